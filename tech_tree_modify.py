@@ -97,6 +97,9 @@ modifications file: modifications.json, this structure (small example):
 	},
 }
 
+NOTE: on install, 'old' also gets a "tech_tree_blocks" entry (<id>:<original RDNode block text>) so that uninstall can restore the
+original TechTree.cfg text (comments, autoLOC keys and all) instead of regenerating it
+
 NOTE: the modifications file will generally only define 'new' OR 'old' but not both -- running this script with 'old' defined will revert, running it with 'new' defined will install
 """
 
@@ -105,13 +108,21 @@ import argparse
 import re
 import time
 import os
+import mmap
+import hashlib
 import warnings
 
 # warnings.filterwarnings('error',category=SyntaxWarning)
 
 MODIFIERS_PARENTS_LIST_KEY = "parents"
+#original text of every RDNode block, saved in 'old' on install so uninstall can put the exact bytes back
+MODIFIERS_TREE_BLOCKS_KEY = "tech_tree_blocks"
 #TODO (eventually) support for non-squad tree data?
 TECH_TREE_CFG_FILE_LOC_FROM_GAMEDATA_DIR = "/Squad/Resources/TechTree.cfg"
+#autoLOC lookup index, kept between runs so we don't have to rescan the localization files every time
+LOCALIZATION_INDEX_FILE_LOC_FROM_KSP_DIR = "/autoLOC_index.json"
+LOCALIZATION_DIR_NAME = "Localization"
+DEFAULT_LOCALIZATION_LANG = "en-us"
 
 X_MIN = -2500
 Y_MIN = 500
@@ -133,6 +144,10 @@ partdef_begin_re = re.compile(r"(?:.{0,3}|\s*)PART")
 open_brace_re = re.compile(r".*\{")
 closed_brace_re = re.compile(r".*\}")
 part_title_re = re.compile(r".*title\s*=\s*(?:.*//\s*(?:#?autoLOC_\S*\s*=)?\s*)?(.*)")
+autoLOC_key_re = re.compile(r"\s*(#autoLOC_\w+)\s*$")#a field value that is nothing but an autoLOC key
+#localization files are scanned as bytes (we need byte offsets for the index)
+loc_defn_re = re.compile(rb"\s*(#[^=\s]+)\s*=[ \t]*(.*?)\s*(?://.*)?$")#capture group 1: key; group 2: value (without any trailing comment)
+loc_block_name_re = re.compile(rb"\s*([\w-]+)\s*(?:\{.*)?$")#block name, possibly followed by its open brace on the same line
 
 #whitelist this (only "PART" is allowed)
 part_igdef_re = re.compile(r"\s*[A-Z]+\s*$")
@@ -151,18 +166,58 @@ tree_auto_fields = ['id',
 tree_parent_auto_fields = ['lineFrom',
 						   'lineTo']
 
-def parse_existing_tree_file(tree_path):
-	flines = None
-	with open(tree_path,'r') as f:
-		flines = f.readlines()
-		flines = [line[:-1] for line in flines]
-		
-	#preprocess the lines
-	#delete the first line (it just says 'TechTree', or if it doesn't, we have the wrong file anyway)
-	if('TechTree' != flines[0][-8:]):
+def parse_existing_tree_file(tree_path,tree_buf=None,node_spans=None):
+	#tree_buf: the raw bytes of the file, if they've already been read
+	#if node_spans is given (a list), one {'id':<id>, 'has_id':<bool>, 'span':[<start byte>,<end byte>], 'hash':<content hash>} is appended
+	#to it for every RDNode block, in file order (see patch_tree_modifications)
+	if tree_buf is None:
+		with open(tree_path,'rb') as f:
+			tree_buf = f.read()
+	
+	#the first line just says 'TechTree' (or if it doesn't, we have the wrong file anyway)
+	first_line = tree_buf.split(b'\n',1)[0].decode('utf-8',errors='replace').rstrip('\r')
+	if('TechTree' != first_line[-8:]):
 		raise ValueError("File provided for the tech tree config ({}) is not a tech tree file (the first line is not 'TechTree' with no whitespace)".format(tree_path))
-	else:
-		flines.pop(0)
+	
+	#parse each RDNode block on its own, so we know where each node came from and its hash only depends on that node
+	out = {}
+	for start,end in find_rdnode_spans(tree_buf):
+		block_nodes = parse_tree_lines(tree_buf[start:end].decode('utf-8',errors='replace').splitlines())
+		for node_id in block_nodes:
+			has_id = 'id' in block_nodes[node_id]
+			if not has_id:
+				warnings.warn("'id = <val>' definition was not found for an RDNode. Its ID will be {}".format(node_id), SyntaxWarning)
+			if node_spans is not None:
+				node_spans.append({'id':node_id,'has_id':has_id,'span':[start,end],'hash':hash_rdnode(block_nodes[node_id])})
+		out.update(block_nodes)
+
+	return out
+
+def find_rdnode_spans(tree_buf):
+	#byte spans of the RDNode blocks directly inside the TechTree block. each span runs from the start of the 'RDNode' line to the end of
+	#the line with its closing brace (newline included), so splicing a span out leaves the surrounding lines untouched
+	spans = []
+	depth = 0
+	block_start = None
+	offset = 0
+	for line in tree_buf.splitlines(keepends=True):
+		line_offset = offset
+		offset += len(line)
+		code = line.split(b'//')[0].decode('utf-8',errors='replace')
+		if (1 == depth) and (rd_node_re.match(code) is not None):
+			block_start = line_offset
+		for char in code:
+			if '{' == char:
+				depth += 1
+			elif '}' == char:
+				depth -= 1
+				if (1 == depth) and (block_start is not None):
+					spans.append((block_start,offset))
+					block_start = None
+	return spans
+
+def parse_tree_lines(flines):
+	#flines: the lines of the tech tree file without the leading 'TechTree' line (or the lines of a single RDNode block)
 	#delete all the brackets (they're not necessary)
 	flines_updated = []
 	for line in flines:
@@ -408,6 +463,125 @@ def parse_existing_part_files(path_to_parts_dir,parts_dict=None):
 	
 	return parts_dict
 
+class AutoLOCResolver:
+	"""
+	Looks up autoLOC keys (e.g. #autoLOC_501020) in the GameData localization files
+
+	Nothing is read until the first lookup. At that point the key -> (file, byte offset, byte length) index is loaded from index_path, or
+	rebuilt (and saved) if any localization file was added, removed or changed since it was written. Values are then read straight out of
+	the files through mmap, so the dictionaries never have to be loaded whole.
+	"""
+	def __init__(self,game_data_dir,index_path,lang=DEFAULT_LOCALIZATION_LANG):
+		self.game_data_dir = game_data_dir
+		self.index_path = index_path
+		self.lang = lang
+		self.keys = None#key:[path,offset,length], populated lazily
+		self.open_maps = {}#path:(file,mmap)
+
+	def find_localization_files(self):
+		#every .cfg anywhere under a 'Localization' directory (index_file picks out our language), with enough stat info to tell if it changed
+		loc_files = {}
+		for dirpath,dirnames,filenames in os.walk(self.game_data_dir):
+			if LOCALIZATION_DIR_NAME not in os.path.normpath(dirpath).split(os.sep):
+				continue
+			for fname in filenames:
+				if '.cfg' == fname[-4:]:
+					fpath = dirpath + '/' + fname
+					fstat = os.stat(fpath)
+					loc_files.update({fpath:[fstat.st_mtime,fstat.st_size]})
+		return loc_files
+
+	def load_index(self):
+		loc_files = self.find_localization_files()
+		#try the saved index first
+		if os.path.isfile(self.index_path):
+			try:
+				with open(self.index_path,'r') as f:
+					saved = json.load(f)
+				if (saved['lang'] == self.lang) and (saved['files'] == loc_files) and isinstance(saved['keys'],dict):
+					self.keys = saved['keys']
+					return
+			except (ValueError,KeyError,TypeError):
+				warnings.warn("autoLOC index {} is unreadable, rebuilding it".format(self.index_path))
+		#missing or stale, rebuild it
+		self.keys = {}
+		for fpath in loc_files:
+			self.index_file(fpath)
+		try:
+			with open(self.index_path,'w') as f:
+				json.dump({'lang':self.lang,'files':loc_files,'keys':self.keys},f)
+		except OSError as e:
+			#not fatal, we just have to rebuild it next time
+			warnings.warn("couldn't save autoLOC index to {} ({})".format(self.index_path,e))
+
+	def index_file(self,fpath):
+		#files look like Localization { <lang> { #key = value ... } }, we only index the block for our language
+		depth = 0
+		block_name = None
+		block_langs = []#language of each open block
+		offset = 0
+		with open(fpath,'rb') as f:
+			for line in f:
+				line_offset = offset
+				offset += len(line)
+				defn_match = loc_defn_re.match(line)
+				if defn_match is not None:
+					if (len(block_langs) > 0) and (block_langs[-1] == self.lang):
+						key = defn_match.group(1).decode('utf-8',errors='replace')
+						if key in self.keys:
+							warnings.warn("autoLOC key {} is defined more than once (keeping the first definition)".format(key))
+						else:
+							self.keys.update({key:[fpath,line_offset + defn_match.start(2),defn_match.end(2) - defn_match.start(2)]})
+					continue
+				code = line.split(b'//')[0]
+				if code.lstrip().startswith(b'#'):
+					#a key line we couldn't parse, its value may contain braces so don't count them
+					continue
+				name_match = loc_block_name_re.match(code)
+				if name_match is not None:
+					block_name = name_match.group(1).decode('utf-8',errors='replace')
+				for char in code:
+					if ord('{') == char:
+						depth += 1
+						#the language blocks sit directly inside the 'Localization' block
+						block_langs.append(block_name if 2 == depth else (block_langs[-1] if len(block_langs) > 0 else None))
+						block_name = None
+					elif (ord('}') == char) and (depth > 0):
+						depth -= 1
+						block_langs.pop(-1)
+
+	def resolve(self,key):
+		#returns None if the key isn't defined for our language
+		if self.keys is None:
+			self.load_index()
+		if key not in self.keys:
+			return None
+		fpath,offset,length = self.keys[key]
+		if fpath not in self.open_maps:
+			f = open(fpath,'rb')
+			self.open_maps.update({fpath:(f,mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ))})
+		return self.open_maps[fpath][1][offset:offset + length].decode('utf-8',errors='replace')
+
+	def close(self):
+		for f,fmap in self.open_maps.values():
+			fmap.close()
+			f.close()
+		self.open_maps = {}
+
+def resolve_autoLOC_fields(fields_dict,fields,resolver):
+	#replace any of the given fields whose value is a bare autoLOC key with its localized value (in place)
+	for field in fields:
+		if field not in fields_dict:
+			continue
+		key_match = autoLOC_key_re.match(fields_dict[field])
+		if key_match is None:
+			continue
+		value = resolver.resolve(key_match.group(1))
+		if value is None:
+			warnings.warn("autoLOC key {} was not found in any localization file, leaving it as-is".format(key_match.group(1)))
+		else:
+			fields_dict[field] = value
+
 def get_modifications(mod_file):
 	return json.load(open(mod_file,'r'))
 
@@ -443,7 +617,7 @@ def generate_nodes_pos(tech_tree,node_depths=None):
 
 	#now we do a depth-first search through the tree. the first path we traverse goes along the top edge (lowest available y-values), then so on from there
 	stack = ['start']
-	next_yv_by_depth = {d:Y_MIN for d in range(num_in_widest_depth)}
+	next_yv_by_depth = {d:Y_MIN for d in depth_hist}
 	tech_tree['start']['pos'][1] = next_yv_by_depth[0]#this is normally added on by the parent, but start has no parent, so do it now
 	next_yv_by_depth[0] += ymax / depth_hist[0]#this shouldn't be necessary -- only 'start' should be at depth 0
 	#we'll use the y-value in tech_tree[node]['pos'] as a 'seen' value
@@ -465,7 +639,7 @@ def generate_nodes_pos(tech_tree,node_depths=None):
 
 	#all of the modifications were done in-place, so we are done
 	
-def auto_populate_missing_fields(tree_mods):
+def auto_populate_missing_fields(tree_mods,existing_tree=None):
 	#only touches certain fields:
 	#	id
 	#	hideEmpty
@@ -477,8 +651,28 @@ def auto_populate_missing_fields(tree_mods):
 	#		lineFrom
 	#		lineTo
 	#and even then only if the user didn't already populate them
+	#nodes that are already in existing_tree (the parsed TechTree.cfg) keep the values they have there instead, so that nodes the user
+	#didn't change come out identical and patch_tree_modifications leaves them alone
+	if existing_tree is None:
+		existing_tree = {}
 
 	for tech_id in tree_mods:
+		if tech_id in existing_tree:
+			existing = existing_tree[tech_id]
+			for field in tree_auto_fields:
+				if (field not in tree_mods[tech_id]) and (field in existing):
+					tree_mods[tech_id].update({field:existing[field]})
+			#parents that were already there keep their line info too
+			existing_pars = {par['parentID']:par for par in existing.get(MODIFIERS_PARENTS_LIST_KEY,[]) if 'parentID' in par}
+			for par in tree_mods[tech_id].get(MODIFIERS_PARENTS_LIST_KEY,[]):
+				if par.get('parentID') not in existing_pars:
+					continue
+				for field in tree_parent_auto_fields:
+					if (field not in par) and (field in existing_pars[par['parentID']]):
+						par.update({field:existing_pars[par['parentID']][field]})
+			#anything else the existing node doesn't define stays undefined
+			continue
+
 		#populate id
 		if 'id' not in tree_mods[tech_id]:
 			tree_mods[tech_id].update({'id':tech_id})
@@ -492,15 +686,21 @@ def auto_populate_missing_fields(tree_mods):
 		if 'scale' not in tree_mods[tech_id]:
 			tree_mods[tech_id].update({'scale':'0.6'})
 		
-		#parent info
+	#parent info (new parents of existing nodes get the defaults too)
+	for tech_id in tree_mods:
 		if MODIFIERS_PARENTS_LIST_KEY in tree_mods[tech_id]:
+			existing_par_ids = {par.get('parentID') for par in existing_tree.get(tech_id,{}).get(MODIFIERS_PARENTS_LIST_KEY,[])}
 			for i in range(len(tree_mods[tech_id][MODIFIERS_PARENTS_LIST_KEY])):
+				if tree_mods[tech_id][MODIFIERS_PARENTS_LIST_KEY][i].get('parentID') in existing_par_ids:
+					continue#already handled above
 				if 'lineFrom' not in tree_mods[tech_id][MODIFIERS_PARENTS_LIST_KEY][i]:
 					tree_mods[tech_id][MODIFIERS_PARENTS_LIST_KEY][i].update({'lineFrom':'RIGHT'})
 				if 'lineTo' not in tree_mods[tech_id][MODIFIERS_PARENTS_LIST_KEY][i]:
 					tree_mods[tech_id][MODIFIERS_PARENTS_LIST_KEY][i].update({'lineTo':'LEFT'})
 
 	#do pos and nodeName (depth) outside of the main loop
+	#the layout needs every node, so remember the existing nodes' values and put them back afterwards
+	kept = {node:{field:tree_mods[node][field] for field in ['nodeName','pos'] if field in tree_mods[node]} for node in tree_mods if node in existing_tree}
 	node_depths = generate_nodes_depth(tree_mods)
 	#nodeName
 	#node<depth>_<id>
@@ -508,39 +708,160 @@ def auto_populate_missing_fields(tree_mods):
 		tree_mods[node].update({'nodeName': 'node{}_{}'.format(node_depths[node],node)})
 	#pos
 	generate_nodes_pos(tree_mods,node_depths=node_depths)
+	for node in kept:
+		tree_mods[node].update(kept[node])
 	#done
 
 def output_modifications(mods,mod_file):
 	json.dump(mods,open(mod_file,'w'),indent='\t')
 	
+def render_rdnode(node):
+	lines = ['\tRDNode\n','\t{\n']
+	for field in node:
+		#parents section handled separately
+		if MODIFIERS_PARENTS_LIST_KEY == field:
+			continue#parents should come last
+		else:
+			if ('pos' == field) and isinstance(node[field],list):
+				lines.append('\t\t{} = {},{},{}\n'.format(field,*node[field]))
+			else:
+				lines.append('\t\t{} = {}\n'.format(field,node[field]))
+	if MODIFIERS_PARENTS_LIST_KEY in node:
+		for par in node[MODIFIERS_PARENTS_LIST_KEY]:
+			lines.append('\t\tParent\n')
+			lines.append('\t\t{\n')
+			for parfield in par:
+				lines.append('\t\t\t{} = {}\n'.format(parfield,par[parfield]))
+			lines.append('\t\t}\n')
+	lines.append('\t}\n')
+	return ''.join(lines)
+
+def normalize_field_val(val):
+	#numbers compare by value (so -2300, "-2300" and "-2300.0" are all the same), everything else by its stripped string
+	try:
+		return repr(float(val))
+	except (TypeError,ValueError):
+		return str(val).strip()
+
+def canonical_rdnode(node):
+	#order-independent form of a node's contents: fields sorted, pos as a list of normalized components, parents compared by content
+	fields = []
+	for field in node:
+		if MODIFIERS_PARENTS_LIST_KEY == field:
+			continue
+		if 'pos' == field:
+			pos = node[field] if isinstance(node[field],list) else str(node[field]).split(',')
+			fields.append([field,[normalize_field_val(comp) for comp in pos]])
+		else:
+			fields.append([field,normalize_field_val(node[field])])
+	parents = [sorted([[parfield,normalize_field_val(par[parfield])] for parfield in par]) for par in node.get(MODIFIERS_PARENTS_LIST_KEY,[])]
+	return [sorted(fields),sorted(parents)]
+
+def hash_rdnode(node):
+	#this (not the rendered text) decides whether a node was modified, so field order and number formatting don't matter
+	return hashlib.sha1(json.dumps(canonical_rdnode(node)).encode('utf-8')).hexdigest()
+
 def apply_tree_modifications(tree_mods,tree_path):
+	#full rewrite of the tree file (comments, autoLOC keys and formatting are all lost -- see patch_tree_modifications)
 	with open(tree_path,'w') as f:
 		f.write('TechTree\n')
 		f.write('{\n')
 		
 		for rdnode in tree_mods:
-			f.write('\tRDNode\n')
-			f.write('\t{\n')
-			for field in tree_mods[rdnode]:
-				#parents section handled separately
-				if MODIFIERS_PARENTS_LIST_KEY == field:
-					continue#parents should come last
-				else:
-					if 'pos' == field:
-						f.write('\t\t{} = {},{},{}\n'.format(field,*tree_mods[rdnode][field]))
-					else:
-						f.write('\t\t{} = {}\n'.format(field,tree_mods[rdnode][field]))
-			if MODIFIERS_PARENTS_LIST_KEY in tree_mods[rdnode]:
-				for par in tree_mods[rdnode][MODIFIERS_PARENTS_LIST_KEY]:
-					f.write('\t\tParent\n')
-					f.write('\t\t{\n')
-					for parfield in par:
-						f.write('\t\t\t{} = {}\n'.format(parfield,par[parfield]))
-					f.write('\t\t}\n')
-			f.write('\t}\n')
+			f.write(render_rdnode(tree_mods[rdnode]))
 		
 		f.write('}\n')
-		
+
+def get_rdnode_blocks(tree_buf,node_spans):
+	#<id>:<original text> for every RDNode block (surrogateescape so that the text turns back into exactly the same bytes)
+	return {block['id']:tree_buf[block['span'][0]:block['span'][1]].decode('utf-8',errors='surrogateescape') for block in node_spans if block['has_id']}
+
+def patch_tree_modifications(tree_mods,tree_path,tree_buf=None,node_spans=None,original_blocks=None):
+	#like apply_tree_modifications, but only the RDNode blocks that were added, removed or changed are rewritten
+	#every other byte of the file (including untouched nodes) is kept as-is. tree_buf/node_spans are what parse_existing_tree_file read
+	#and recorded for this file (if they aren't given, the file is read and parsed here)
+	#original_blocks (from get_rdnode_blocks) is used in place of regenerating a node whenever it still matches that node's contents
+	#returns the number of RDNode blocks that were added, removed or rewritten (on a full rewrite, the number of blocks written)
+	if (tree_buf is None) or (node_spans is None):
+		with open(tree_path,'rb') as f:
+			tree_buf = f.read()
+		node_spans = []
+		parse_existing_tree_file(tree_path,tree_buf=tree_buf,node_spans=node_spans)
+
+	#we can only splice if every block maps to exactly one id -- otherwise we'd be replacing or dropping the wrong bytes
+	spans_by_id = {}
+	for block in node_spans:
+		if not block['has_id']:
+			warnings.warn("tech tree file {} has an RDNode without an id, rewriting the whole file".format(tree_path))
+			apply_tree_modifications(tree_mods,tree_path)
+			return len(tree_mods)
+		if block['id'] in spans_by_id:
+			warnings.warn("tech tree file {} defines RDNode {} more than once, rewriting the whole file".format(tree_path,block['id']))
+			apply_tree_modifications(tree_mods,tree_path)
+			return len(node_spans) + len(tree_mods)
+		spans_by_id.update({block['id']:block})
+
+	newline = '\r\n' if b'\r\n' in tree_buf else '\n'
+
+	if original_blocks is None:
+		original_blocks = {}
+
+	def render_bytes(node_id):
+		#put the original text back if we have it and it's still the same node
+		if node_id in original_blocks:
+			original_nodes = parse_tree_lines(original_blocks[node_id].splitlines())
+			if (node_id in original_nodes) and (hash_rdnode(original_nodes[node_id]) == hash_rdnode(tree_mods[node_id])):
+				return original_blocks[node_id].encode('utf-8',errors='surrogateescape')
+		return render_rdnode(tree_mods[node_id]).replace('\n',newline).encode('utf-8')
+
+	#(start,end,replacement) for every change, spans never overlap
+	edits = []
+	changed_blocks = 0
+	for node_id in spans_by_id:
+		start,end = spans_by_id[node_id]['span']
+		if node_id not in tree_mods:
+			#removed
+			edits.append((start,end,b''))
+			changed_blocks += 1
+		elif hash_rdnode(tree_mods[node_id]) != spans_by_id[node_id]['hash']:
+			#modified
+			edits.append((start,end,render_bytes(node_id)))
+			changed_blocks += 1
+
+	#added nodes go right after the node before them in tree_mods (so uninstall puts removed nodes back where they were)
+	#if nothing before them is in the file, they go before the first node (or just before the TechTree closing brace if there are none)
+	if len(spans_by_id) > 0:
+		insert_at = min([spans_by_id[node_id]['span'][0] for node_id in spans_by_id])
+	else:
+		close_idx = tree_buf.rfind(b'}')
+		if -1 == close_idx:
+			raise ValueError("tech tree file {} has no closing brace".format(tree_path))
+		insert_at = tree_buf.rfind(b'\n',0,close_idx) + 1
+	for node_id in tree_mods:
+		if node_id in spans_by_id:
+			insert_at = spans_by_id[node_id]['span'][1]
+		else:
+			#edits at the same spot stay in tree_mods order (the sort below is stable)
+			edits.append((insert_at,insert_at,render_bytes(node_id)))
+			changed_blocks += 1
+
+	if 0 == len(edits):
+		return 0
+
+	#splice the edits into the original buffer
+	edits.sort(key=lambda edit: (edit[0],edit[1]))
+	pieces = []
+	prev_end = 0
+	for start,end,replacement in edits:
+		pieces.append(tree_buf[prev_end:start])
+		pieces.append(replacement)
+		prev_end = end
+	pieces.append(tree_buf[prev_end:])
+
+	with open(tree_path,'wb') as f:
+		f.write(b''.join(pieces))
+	return changed_blocks
+
 def apply_part_modifications(part_mods):
 	for part_id in part_mods:
 		path = part_mods[part_id]['cfg_path']
@@ -617,7 +938,11 @@ if __name__ == '__main__':
 	#trying to load the json in get_modifications will throw an error if it isn't syntactically correct, so no need to do so here
 	
 	#load/parse the existing tech tree
-	current_tech_tree = parse_existing_tree_file(game_data_dir + TECH_TREE_CFG_FILE_LOC_FROM_GAMEDATA_DIR)
+	tree_path = game_data_dir + TECH_TREE_CFG_FILE_LOC_FROM_GAMEDATA_DIR
+	with open(tree_path,'rb') as f:
+		tree_buf = f.read()
+	tree_spans = []#where each node is in tree_buf, so install/uninstall only have to patch the blocks that change
+	current_tech_tree = parse_existing_tree_file(tree_path,tree_buf=tree_buf,node_spans=tree_spans)
 	#load/parse the existing parts
 	#	find all of the 'Parts' directories
 	pdirs = {dirpath for dirpath,_,_ in os.walk(game_data_dir) if '\\Parts' == dirpath[-6:]}
@@ -640,6 +965,14 @@ if __name__ == '__main__':
 
 		current_tech_tree = new_tech_tree
 
+		#fill in any titles/descriptions that are still raw autoLOC keys (i.e. the cfg didn't have a comment telling us the english)
+		loc_resolver = AutoLOCResolver(game_data_dir, ksp_dir + LOCALIZATION_INDEX_FILE_LOC_FROM_KSP_DIR)
+		for tech in current_tech_tree:
+			resolve_autoLOC_fields(current_tech_tree[tech],['title','description'],loc_resolver)
+		for part in current_parts:
+			resolve_autoLOC_fields(current_parts[part],['title'],loc_resolver)
+		loc_resolver.close()
+
 		#format the dict we're going to throw into the mod file
 		modf_data = {'old':{'tech_tree':{},'parts':{}},
 					 'new':{'tech_tree':{},'parts':{}}}
@@ -656,14 +989,16 @@ if __name__ == '__main__':
 		#installation
 		if 'install' == action:
 			#auto populate missing stuff from the file
-			auto_populate_missing_fields(all_modf_data['new']['tech_tree'])
-			#format the old modfile data
-			all_modf_data.update({'old':{'tech_tree':current_tech_tree, 'parts':current_parts}})
+			auto_populate_missing_fields(all_modf_data['new']['tech_tree'],existing_tree=current_tech_tree)
+			#format the old modfile data (with the original block text, so uninstall can restore it exactly)
+			all_modf_data.update({'old':{'tech_tree':current_tech_tree, 'parts':current_parts,
+										 MODIFIERS_TREE_BLOCKS_KEY:get_rdnode_blocks(tree_buf,tree_spans)}})
 			# exit(1)
 			#push the changes to the json file
 			output_modifications(all_modf_data,mod_file)
 			#finally, do the install itself
-			apply_tree_modifications(all_modf_data['new']['tech_tree'], game_data_dir + TECH_TREE_CFG_FILE_LOC_FROM_GAMEDATA_DIR)
+			changed_blocks = patch_tree_modifications(all_modf_data['new']['tech_tree'], tree_path, tree_buf=tree_buf, node_spans=tree_spans)
+			print("{} of {} tech tree nodes written or removed".format(changed_blocks,len(all_modf_data['new']['tech_tree'])))
 			apply_part_modifications(all_modf_data['new']['parts'])
 			#done, exit normally
 			exit(0)
@@ -671,8 +1006,9 @@ if __name__ == '__main__':
 		elif 'uninstall' == action:
 			#works just like install, but we populate the 'old' values, not the 'new' ones
 			#just do the (un)install itself
-			apply_tree_modifications(all_modf_data['old']['tech_tree'],
-									 game_data_dir+TECH_TREE_CFG_FILE_LOC_FROM_GAMEDATA_DIR)
+			changed_blocks = patch_tree_modifications(all_modf_data['old']['tech_tree'], tree_path, tree_buf=tree_buf, node_spans=tree_spans,
+													  original_blocks=all_modf_data['old'].get(MODIFIERS_TREE_BLOCKS_KEY))
+			print("{} of {} tech tree nodes written or removed".format(changed_blocks,len(all_modf_data['old']['tech_tree'])))
 			apply_part_modifications(all_modf_data['old']['parts'])
 			#done, exit normally
 			exit(0)
\ No newline at end of file